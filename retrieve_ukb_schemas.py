@@ -1,43 +1,86 @@
 """
-Download reference UK Biobank schemas, saves to schemas/SCHEMA_DESCRIPTION(.YYYYMMDD).txt 
+Download reference UK Biobank schemas, saves to schemas/SCHEMA_DESCRIPTION(.YYYYMMDD).txt
 
 See: https://biobank.ndph.ox.ac.uk/showcase/download.cgi
 """
 
 __author__ = "Thomas Kaplan"
 
-import re
+import os
 import requests
+import shutil
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 BIOBANK_DOMAIN = "https://biobank.ndph.ox.ac.uk"
 SCHEMA_URL = f"{BIOBANK_DOMAIN}/showcase/download.cgi"
 
+# Concurrent downloads, kept low to avoid hammering the showcase server
+MAX_WORKERS = 8
+
 
 def _get_schema_dl_url(schema_i):
     return f"{BIOBANK_DOMAIN}/ukb/scdown.cgi?fmt=txt&id={schema_i}"
 
 
+def _download_schema(session, schema_i, path):
+    """Stream a schema straight to disk, without buffering it in memory
+
+    The schema is streamed to a temporary file and then replaces path, so a
+    failed download never truncates an existing schema (or its hard links).
+    """
+    tmp_path = f"{path}.{os.getpid()}.part"
+    try:
+        with session.get(_get_schema_dl_url(schema_i), stream=True) as response:
+            response.raw.decode_content = True
+            with open(tmp_path, "wb") as file:
+                shutil.copyfileobj(response.raw, file)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _link_or_copy(src, dst):
+    """Hard link dst to src, falling back to a copy (e.g. across devices)"""
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _retrieve_schema(session, desc, schema_i, yyyymmdd):
+    dated_path = f"schemas/{desc}.{yyyymmdd}.txt"
+    _download_schema(session, schema_i, dated_path)
+    _link_or_copy(dated_path, f"schemas/{desc}.txt")
+
+
 if __name__ == "__main__":
 
     yyyymmdd = datetime.today().strftime("%Y%m%d")
 
     page = requests.get(SCHEMA_URL)
-    soup = BeautifulSoup(page.content, "html.parser")
-    is_schema_link = lambda href: href is not None and "schema.cgi?id=" in href
-    schema_links = soup.find_all("a", href=is_schema_link)
+    soup = BeautifulSoup(page.content, "lxml")
+    schema_links = soup.select('a[href*="schema.cgi?id="]')
 
+    schemas = []
     for link in schema_links:
         desc = "_".join([d for d in link.text.lower().split() if d])
-        schema_i = re.search(r"\d+", link["href"]).group()
-        schema_url = _get_schema_dl_url(schema_i)
-        response = requests.get(schema_url)
-
-        print(f"Writing schema {schema_i} (dates {yyyymmdd} and undated)")
+        schema_i = link["href"].rsplit("=", 1)[1]
+        schemas.append((desc, schema_i))
 
-        with open(f"schemas/{desc}.{yyyymmdd}.txt", "wb") as file:
-            file.write(response.content)
+    with requests.Session() as session:
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_WORKERS)
+        session.mount("https://", adapter)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(_retrieve_schema, session, desc, schema_i, yyyymmdd)
+                for desc, schema_i in schemas
+            ]
 
-        with open(f"schemas/{desc}.txt", "wb") as file:
-            file.write(response.content)
+            for (desc, schema_i), future in zip(schemas, futures):
+                future.result()
+                print(f"Written schema {schema_i} (dated {yyyymmdd} and undated)")
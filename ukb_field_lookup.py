@@ -20,16 +20,29 @@ TODO:
 __author__ = "Thomas Kaplan"
 
 import argparse
+import csv
+import dataclasses
 import functools
+import numpy as np
 import os
 import pandas as pd
+import pickle
 import re
 import sys
 import tabulate
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, Union
 
+try:
+    import pyarrow
+    import pyarrow.csv
+    import pyarrow.parquet
+except ImportError:
+    # Optional, schemas are then parsed by pandas on every run
+    pyarrow = None
+
 VERBOSE = False
 
 OUT_HEADER = ["field_id", "title", "dtype", "categories", "encoding_id", "description"]
@@ -37,6 +50,10 @@ OUT_HEADER = ["field_id", "title", "dtype", "categories", "encoding_id", "descri
 DIR_PATH = os.path.dirname(os.path.realpath(__file__))
 DATA_FIELD_PROPERTIES_PATH = f"{DIR_PATH}/schemas/data_field_properties.txt"
 ENCODING_DICTIONARIES_PATH = f"{DIR_PATH}/schemas/encoding_dictionaries.txt"
+LOOKUP_INDEX_PATH = f"{DIR_PATH}/schemas/.lookup_index.pkl"
+ENCODING_VALUES_INDEX_PATH = f"{DIR_PATH}/schemas/.encoding_values_index.pkl"
+# Bump whenever the tables held in the lookup indexes change
+LOOKUP_INDEX_VERSION = 2
 NOT_ENCODED = "NOT-ENCODED"
 
 ENCODING_VALUES_HIER_INT_PATH = (
@@ -99,10 +116,13 @@ class UKBField:
 
     # UKB field Regex: "84" (FIELD) / "84-0.1" (FIELD-INSTANCE.ARRAY)
     FIELD_PATTERN = r"(\d+)(?:-(\d+))?(?:\.(\d+))?"
+    FIELD_PATTERN_RE = re.compile(FIELD_PATTERN)
+    # Batched form, matching each line of newline-separated fields
+    FIELDS_PATTERN_RE = re.compile(rf"^{FIELD_PATTERN}.*$", re.MULTILINE)
 
     @classmethod
     def from_str(cls, field: str):
-        matches = re.match(cls.FIELD_PATTERN, field)
+        matches = cls.FIELD_PATTERN_RE.match(field)
         if not matches:
             raise ValueError(
                 f"Invalid field '{field}', expected pattern: {cls.FIELD_PATTERN}"
@@ -114,83 +134,432 @@ class UKBField:
             matches.group(3) or None,
         )
 
+    @classmethod
+    def from_strs(cls, fields: list) -> list:
+        """Parse many fields, with a single regex scan across all of them"""
+        joined = "\n".join(fields)
+        matches = cls.FIELDS_PATTERN_RE.findall(joined)
+        if len(matches) != len(fields) or joined.count("\n") != len(fields) - 1:
+            # Invalid or multi-line field(s), fall back to reporting them singly
+            return [cls.from_str(f) for f in fields]
+        return [
+            cls(int(field_id), instance_id or None, array_id or None)
+            for field_id, instance_id, array_id in matches
+        ]
+
+
+@dataclass(frozen=True, slots=True)
+class UKBFieldRecord:
+    """Metadata associated with a field, as per OUT_HEADER"""
+
+    field_id: int
+    title: str
+    dtype: str
+    categories: int
+    encoding_id: int
+    description: str
+
 
-def _is_singleton(field_id: int, schema_df: pd.DataFrame) -> bool:
+def _is_singleton(field_id: int, schema_recs: list) -> bool:
     """Check whether a single record is identified for a field
 
     :param field_id int: UKB field ID
-    :param schema_df pd.DataFrame: Indexed records within the schema
+    :param schema_recs list: Indexed records within the schema
     :returns bool: if a single record is found in the schema
     """
-    if schema_df.empty:
+    if not schema_recs:
         if VERBOSE:
             print(f"No fields found for ID={field_id}")
         return False
-    elif schema_df.shape[0] > 1:
+    elif len(schema_recs) > 1:
         if VERBOSE:
             print(
-                f"Multiple fields ({schema_df.shape[0]}) found for the same ID={field_id}"
+                f"Multiple fields ({len(schema_recs)}) found for the same ID={field_id}"
             )
         return False
     return True
 
 
+def _group_records(schema_df: pd.DataFrame, key: str) -> dict:
+    """Group schema records by an ID column, for constant-time lookup
+
+    :param schema_df pd.DataFrame: Records within the schema
+    :param key str: Column holding the ID
+    :returns dict: ID to list of records (as named tuples)
+    """
+    recs = {}
+    for rec in schema_df.itertuples(index=False):
+        recs.setdefault(getattr(rec, key), []).append(rec)
+    return recs
+
+
+def _is_newer(path: str, than_path: str) -> bool:
+    """Check whether a file exists and was modified after another"""
+    return os.path.exists(path) and os.path.getmtime(path) > os.path.getmtime(than_path)
+
+
+def _read_csv_arrow(
+    path: str, dtype: Optional[dict] = None, encoding: Optional[str] = None
+) -> "pyarrow.Table":
+    """Read a tab-delimited schema with pyarrow's memory-mapped, multithreaded parser
+
+    :param path str: Path to the schema
+    :param dtype dict: Column types, inferred by default
+    :param encoding str: Text encoding of the schema
+    :returns pyarrow.Table: schema records, with the same types as pandas infers
+    """
+
+    def _to_arrow_type(col_dtype):
+        col_dtype = pd.api.types.pandas_dtype(col_dtype)
+        if isinstance(col_dtype, pd.CategoricalDtype):
+            return pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+        return pyarrow.from_numpy_dtype(col_dtype)
+
+    column_types = {
+        col: _to_arrow_type(col_dtype) for col, col_dtype in (dtype or {}).items()
+    }
+
+    def _read(column_types):
+        with pyarrow.memory_map(path) as source:
+            return pyarrow.csv.read_csv(
+                source,
+                read_options=pyarrow.csv.ReadOptions(
+                    use_threads=True, encoding=encoding or "utf8"
+                ),
+                parse_options=pyarrow.csv.ParseOptions(
+                    delimiter="\t", newlines_in_values=True
+                ),
+                convert_options=pyarrow.csv.ConvertOptions(
+                    column_types=column_types, strings_can_be_null=True
+                ),
+            )
+
+    table = _read(column_types)
+    # Unlike pandas, pyarrow infers dates/times, so re-read these as text
+    temporal = [f.name for f in table.schema if pyarrow.types.is_temporal(f.type)]
+    if temporal:
+        table = _read({**column_types, **{col: pyarrow.string() for col in temporal}})
+    return table
+
+
+def _nulls_as_nan(df: pd.DataFrame) -> pd.DataFrame:
+    """Represent missing text as NaN (rather than pyarrow's None), as pandas does"""
+    obj_cols = df.select_dtypes(include="object").columns
+    return df.assign(**{col: df[col].fillna(np.nan) for col in obj_cols})
+
+
+def _read_schema(
+    path: str,
+    usecols: Optional[list] = None,
+    dtype: Optional[dict] = None,
+    encoding: Optional[str] = None,
+    cache: bool = True,
+) -> pd.DataFrame:
+    """Read a tab-delimited schema, via a Parquet copy where possible
+
+    If pyarrow is available, the first read of a schema writes a Parquet copy
+    alongside it (SCHEMA.txt.parquet), which is read instead until the schema
+    is updated. The TXT is then parsed by pyarrow rather than pandas. Otherwise,
+    only the requested columns are parsed.
+
+    :param path str: Path to the schema
+    :param usecols list: Columns to read, all by default
+    :param dtype dict: Column types, inferred by default
+    :param encoding str: Text encoding of the schema
+    :param cache bool: Whether to use a Parquet copy, e.g. not for schemas only
+        read to build a pickled lookup index
+    :returns pd.DataFrame: schema records
+    """
+    parquet_path = f"{path}.parquet"
+    if cache and pyarrow is not None and _is_newer(parquet_path, path):
+        try:
+            df = _nulls_as_nan(pd.read_parquet(parquet_path, columns=usecols))
+            return df if dtype is None else df.astype(dtype)
+        except (OSError, pyarrow.ArrowException) as e:
+            # e.g. a corrupt copy, fall through to re-parsing the TXT
+            if VERBOSE:
+                print(f"Unable to read cached schema {parquet_path}: {e}")
+
+    if pyarrow is None:
+        return pd.read_csv(
+            path, delimiter="\t", encoding=encoding, usecols=usecols, dtype=dtype
+        )
+
+    # The Parquet copy holds all columns, so later reads may project any subset
+    table = _read_csv_arrow(path, dtype=dtype, encoding=encoding)
+    if cache:
+        # Written atomically, so concurrent/interrupted runs never leave a partial copy
+        tmp_path = f"{parquet_path}.{os.getpid()}"
+        try:
+            pyarrow.parquet.write_table(table, tmp_path, compression="snappy")
+            os.replace(tmp_path, parquet_path)
+        except (OSError, pyarrow.ArrowException) as e:
+            # Caching is best-effort, e.g. schemas directory may be read-only
+            if VERBOSE:
+                print(f"Unable to cache schema {path} as Parquet: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    df = _nulls_as_nan(table.to_pandas(split_blocks=True, self_destruct=True))
+    return df if usecols is None else df[usecols]
+
+
+def _read_data_field_properties() -> pd.DataFrame:
+    """Read the data field properties schema, with the data type of each field"""
+    df = _read_schema(
+        DATA_FIELD_PROPERTIES_PATH,
+        usecols=["field_id", "title", "value_type", "encoding_id", "notes"],
+        dtype={"field_id": "int32", "value_type": "int16", "encoding_id": "int32"},
+        cache=False,
+    )
+    dtypes = df.value_type.map(UKB_VALUE_TYPE_INV).fillna(UKBValueType.UNKNOWN.name)
+    return df.assign(dtype=dtypes.astype("category"))
+
+
+def _read_encoding_dictionaries() -> pd.DataFrame:
+    """Read the encoding dictionaries schema, with the categories of each encoding"""
+    df = _read_schema(
+        ENCODING_DICTIONARIES_PATH,
+        usecols=["encoding_id", "title", "num_members"],
+        dtype={"encoding_id": "int32", "num_members": "int32", "title": "category"},
+        cache=False,
+    )
+    # Computed once for all encodings, unencoded fields have no categories. As
+    # title is categorical, this compares integer codes rather than strings.
+    return df.assign(categories=df.num_members.where(df.title != NOT_ENCODED, 0))
+
+
+def _read_encoding_values_index() -> dict:
+    """Map each encoding ID to the first encoding values schema defining it
+
+    Only the ID column is parsed, values are loaded on demand per schema. The
+    schemas are read concurrently, as this is dominated by I/O on a cold cache.
+
+    :returns dict: encoding ID to index of the schema within ENCODING_PATHS
+    """
+
+    def _read_encoding_ids(enc_path):
+        return _read_schema(
+            enc_path,
+            usecols=["encoding_id"],
+            dtype={"encoding_id": "int32"},
+            encoding="ISO-8859-1",
+        ).encoding_id.unique()
+
+    index = {}
+    with ThreadPoolExecutor(max_workers=len(ENCODING_PATHS)) as executor:
+        all_enc_ids = executor.map(_read_encoding_ids, ENCODING_PATHS)
+        for enc_i, enc_ids in enumerate(all_enc_ids):
+            for enc_id in enc_ids.tolist():
+                index.setdefault(enc_id, enc_i)
+    return index
+
+
+def _load_pickled(pickle_path: str, schema_paths: list, read) -> dict:
+    """Load tables read from schemas, persisted between runs
+
+    The tables are pickled on first use, and unpickled by later runs until any
+    of the schemas are updated.
+
+    :param pickle_path str: Path to pickle the tables to
+    :param schema_paths list: Paths to the schemas the tables are read from
+    :param read callable: Reads the tables from the schemas, as a dict
+    :returns dict: tables, by name
+    """
+    if all(_is_newer(pickle_path, p) for p in schema_paths):
+        try:
+            with open(pickle_path, "rb") as file:
+                index = pickle.load(file)
+            if index.get("version") == LOOKUP_INDEX_VERSION:
+                return index
+        except Exception as e:
+            # e.g. corrupt, or pickled by an incompatible pandas, so rebuild it
+            if VERBOSE:
+                print(f"Unable to read lookup index {pickle_path}: {e}")
+
+    index = {"version": LOOKUP_INDEX_VERSION, **read()}
+    # Written atomically, so concurrent runs never read a partial index
+    tmp_path = f"{pickle_path}.{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as file:
+            pickle.dump(index, file, protocol=5)
+        os.replace(tmp_path, pickle_path)
+    except (OSError, pickle.PicklingError) as e:
+        # Caching is best-effort, e.g. schemas directory may be read-only
+        if VERBOSE:
+            print(f"Unable to write lookup index {pickle_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def _load_lookup_index() -> dict:
+    """Load the schema tables used for field lookups, persisted between runs"""
+    return _load_pickled(
+        LOOKUP_INDEX_PATH,
+        [DATA_FIELD_PROPERTIES_PATH, ENCODING_DICTIONARIES_PATH],
+        lambda: {
+            "data_field_properties": _read_data_field_properties(),
+            "encoding_dictionaries": _read_encoding_dictionaries(),
+        },
+    )
+
+
+def _load_data_field_properties() -> pd.DataFrame:
+    """Load the data field properties schema"""
+    return _load_lookup_index()["data_field_properties"]
+
+
+def _load_encoding_dictionaries() -> pd.DataFrame:
+    """Load the encoding dictionaries schema, with the categories of each encoding"""
+    return _load_lookup_index()["encoding_dictionaries"]
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding_values_index() -> dict:
+    """Map each encoding ID to the index of its schema within ENCODING_PATHS
+
+    Persisted between runs separately from the lookup index, so that field
+    lookups never need the encoding values schemas.
+    """
+    return _load_pickled(
+        ENCODING_VALUES_INDEX_PATH,
+        ENCODING_PATHS,
+        lambda: {"encoding_values": _read_encoding_values_index()},
+    )["encoding_values"]
+
+
+@functools.lru_cache(maxsize=None)
+def _data_field_properties_by_id() -> dict:
+    """Data field properties, grouped by field ID"""
+    return _group_records(_load_data_field_properties(), "field_id")
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding_dictionaries_by_id() -> dict:
+    """Encoding dictionaries, grouped by encoding ID"""
+    return _group_records(_load_encoding_dictionaries(), "encoding_id")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_encoding_values(enc_path: str) -> pd.DataFrame:
+    """Load an encoding values schema, indexed by encoding ID
+
+    :param enc_path str: Path to one of the encoding values schemas
+    """
+    df = _read_schema(
+        enc_path,
+        usecols=["encoding_id", "value"],
+        dtype={"encoding_id": "int32"},
+        encoding="ISO-8859-1",
+    )
+    return df.set_index("encoding_id", drop=False)
+
+
+def _lookup(key: int, schema_df: pd.DataFrame) -> pd.DataFrame:
+    """Select all records for a key within an indexed schema
+
+    :param key int: UKB field or encoding ID
+    :param schema_df pd.DataFrame: Schema indexed by the ID
+    :returns pd.DataFrame: matching records, empty if none are found
+    """
+    if key not in schema_df.index:
+        return schema_df.iloc[:0]
+    return schema_df.loc[[key]]
+
+
 def get_encoding_values(encoding_id: int) -> list:
     """Retrieve values for a given encoded field
 
     :param encoding_id int: Encoding ID for a UKB field
     :returns list: possible values, empty if encoding ID cannot be reconciled
     """
-    for enc_path in ENCODING_PATHS:
-        enc_df = pd.read_csv(enc_path, delimiter="\t", encoding="ISO-8859-1")
-        if encoding_id in enc_df.encoding_id.values:
-            encodings = enc_df[enc_df.encoding_id == encoding_id]
-            return encodings.value.values.tolist()
-    return []
+    enc_i = _encoding_values_index().get(encoding_id)
+    if enc_i is None:
+        return []
+    encodings = _lookup(encoding_id, _load_encoding_values(ENCODING_PATHS[enc_i]))
+    return encodings.value.values.tolist()
 
 
-class UKBFieldMetadata:
+def _to_field_id(field: Union[int, str]) -> int:
+    """Resolve the field ID, dropping any instance and array IDs (if str)"""
+    return UKBField.from_str(field).field_id if isinstance(field, str) else field
+
+
+def _to_field_ids(fields: list) -> list:
+    """Resolve many field IDs, parsing any str fields as a batch"""
+    parsed = iter(UKBField.from_strs([f for f in fields if isinstance(f, str)]))
+    return [next(parsed).field_id if isinstance(f, str) else f for f in fields]
 
-    _data_prop_df = pd.read_csv(DATA_FIELD_PROPERTIES_PATH, delimiter="\t")
-    _enc_dict_df = pd.read_csv(ENCODING_DICTIONARIES_PATH, delimiter="\t")
 
+class UKBFieldMetadata:
     @classmethod
-    def get_field(cls, field: Union[int, str]) -> dict:
+    def get_field(cls, field: Union[int, str]) -> Optional[UKBFieldRecord]:
         """Find metadata associated with a field
 
         :param field [str,int]: UKB field ID, possibly including array and instance IDs (if str)
-        :returns dict: metadata if found, else an empty dict
+        :returns UKBFieldRecord: metadata if found, else None
         """
-        field_id = (
-            UKBField.from_str(field).field_id if isinstance(field, str) else field
-        )
+        field_id = _to_field_id(field)
 
-        prop_df = cls._data_prop_df[cls._data_prop_df.field_id == field_id]
-        if not _is_singleton(field_id, prop_df):
-            return {}
-        prop = prop_df.iloc[0]
+        props = _data_field_properties_by_id().get(field_id, [])
+        if not _is_singleton(field_id, props):
+            return None
+        prop = props[0]
 
-        def _get_value_type_id(value_type):
-            try:
-                return UKB_VALUE_TYPE_INV[value_type]
-            except KeyError:
-                return UKBValueType.UNKNOWN.name
-        dtype = _get_value_type_id(prop.value_type)
+        dtype = prop.dtype
 
         enc_id = prop.encoding_id
-        enc_df = cls._enc_dict_df[cls._enc_dict_df.encoding_id == enc_id]
-        if not _is_singleton(field_id, enc_df):
-            return {}
-
-        enc = enc_df.iloc[0]
-        if enc.title == NOT_ENCODED:
-            categs = 0
-        else:
-            categs = enc.num_members
-
-        return dict(
-            zip(OUT_HEADER, [field_id, prop.title, dtype, categs, enc_id, prop.notes])
+        encs = _encoding_dictionaries_by_id().get(enc_id, [])
+        if not _is_singleton(field_id, encs):
+            return None
+
+        categs = encs[0].categories
+
+        return UKBFieldRecord(field_id, prop.title, dtype, categs, enc_id, prop.notes)
+
+    @classmethod
+    def get_fields(cls, fields: list) -> list:
+        """Find metadata associated with many fields, in a single pass
+
+        :param fields list: UKB field IDs, as accepted by get_field
+        :returns list: metadata (UKBFieldRecord) for each field found, in order
+        """
+        # Each distinct field is parsed and looked up once, e.g. "4" and "4-0.1"
+        unique_fields = list(dict.fromkeys(fields))
+        field_id_of = dict(zip(unique_fields, _to_field_ids(unique_fields)))
+        unique_ids = list(dict.fromkeys(field_id_of.values()))
+        field_ids = pd.DataFrame({"field_id": unique_ids})
+
+        # Fields/encodings must be identified by a single record, as in get_field
+        prop_df = _load_data_field_properties()
+        prop_df = prop_df[prop_df.field_id.isin(field_ids.field_id)]
+        prop_df = prop_df[~prop_df.field_id.duplicated(keep=False)]
+        enc_df = _load_encoding_dictionaries()
+        enc_df = enc_df[~enc_df.encoding_id.duplicated(keep=False)]
+
+        out_df = field_ids.merge(prop_df, on="field_id").merge(
+            enc_df[["encoding_id", "categories"]], on="encoding_id"
         )
+        if VERBOSE:
+            # Report why each field was dropped as get_field does, in requested order
+            found = set(out_df.field_id)
+            for field_id in unique_ids:
+                if field_id in found:
+                    continue
+                props = _data_field_properties_by_id().get(field_id, [])
+                if _is_singleton(field_id, props):
+                    encs = _encoding_dictionaries_by_id().get(props[0].encoding_id, [])
+                    _is_singleton(field_id, encs)
+
+        out_df = out_df.rename(columns={"notes": "description"})
+        recs = [
+            UKBFieldRecord(*rec)
+            for rec in out_df[OUT_HEADER].itertuples(index=False, name=None)
+        ]
+        recs = {rec.field_id: rec for rec in recs}
+        # Back to the order (and repetitions) requested
+        return [recs[field_id_of[f]] for f in fields if field_id_of[f] in recs]
 
 
 def get_ukb_field(field: Union[int, str]) -> dict:
@@ -199,7 +568,36 @@ def get_ukb_field(field: Union[int, str]) -> dict:
     :param field [str,int]: UKB field ID, possibly including array and instance IDs (if str)
     :returns dict: metadata if found, else an empty dict
     """
-    return UKBFieldMetadata.get_field(field)
+    rec = UKBFieldMetadata.get_field(field)
+    return dataclasses.asdict(rec) if rec is not None else {}
+
+
+def get_ukb_fields(fields: list) -> list:
+    """Find metadata associated with many UKB fields
+
+    :param fields list: UKB field IDs, possibly including array and instance IDs (if str)
+    :returns list: metadata (UKBFieldRecord) for each field found, in order
+    """
+    return UKBFieldMetadata.get_fields(fields)
+
+
+def _to_cell(value) -> str:
+    """Format a value for output, leaving missing values (e.g. no description) blank"""
+    return "" if pd.isna(value) else str(value)
+
+
+def _format_table(recs: list) -> str:
+    """Format records as a simple table, faster than tabulate for many records
+
+    :param recs list: metadata (UKBFieldRecord) for each field
+    :returns str: left-aligned columns, as per OUT_HEADER
+    """
+    rows = [[_to_cell(getattr(r, h)) for h in OUT_HEADER] for r in recs]
+    widths = [max(map(len, col)) for col in zip(OUT_HEADER, *rows)]
+    fmt = "  ".join(f"{{:<{w}}}" for w in widths)
+    lines = [fmt.format(*OUT_HEADER), fmt.format(*("-" * w for w in widths))]
+    lines += [fmt.format(*row) for row in rows]
+    return "\n".join(line.rstrip() for line in lines)
 
 
 def main(args):
@@ -207,8 +605,7 @@ def main(args):
         global VERBOSE
         VERBOSE = True
 
-    recs = [get_ukb_field(field_id) for field_id in args.field_ids]
-    recs = [r for r in recs if r]
+    recs = get_ukb_fields(args.field_ids)
 
     if args.print:
         if VERBOSE:
@@ -216,10 +613,18 @@ def main(args):
         print(tabulate.tabulate(recs, headers="keys"))
         sys.exit(0)
 
-    out_df = pd.DataFrame(recs, columns=OUT_HEADER)
-    print(
-        out_df.drop(columns=["description"], axis=1).to_csv(None, sep=";", index=False)
-    )
+    if args.fast_print:
+        if VERBOSE:
+            print()
+        print(_format_table(recs))
+        sys.exit(0)
+
+    # Streamed straight to stdout, the description is omitted for brevity
+    header = [h for h in OUT_HEADER if h != "description"]
+    writer = csv.writer(sys.stdout, delimiter=";", lineterminator="\n")
+    writer.writerow(header)
+    writer.writerows([_to_cell(getattr(r, h)) for h in header] for r in recs)
+    print()
 
 
 if __name__ == "__main__":
@@ -229,7 +634,15 @@ if __name__ == "__main__":
     parser.add_argument(
         "field_ids", metavar="N", nargs="+", type=str, help="UKB field index"
     )
-    parser.add_argument("--print", action="store_true", help="Print in tabulated form")
+    print_group = parser.add_mutually_exclusive_group()
+    print_group.add_argument(
+        "--print", action="store_true", help="Print in tabulated form"
+    )
+    print_group.add_argument(
+        "--fast-print",
+        action="store_true",
+        help="Print in a simpler tabulated form, faster for many fields",
+    )
     parser.add_argument(
         "--verbose", action="store_true", help="Print debugging information"
     )